@@ -2,16 +2,22 @@
 Advanced Task Management API
 A comprehensive REST API for managing tasks with priority, assignments, and analytics
 """
-from fastapi import FastAPI, HTTPException, Query, BackgroundTasks
+from fastapi import FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, Field, field_validator
-from typing import Optional, List, Dict
-from datetime import datetime, timedelta
+from fastapi.responses import ORJSONResponse
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field, field_validator
+from typing import Annotated, Optional, List, Dict, Set
+from collections import Counter, defaultdict
+from datetime import datetime
+from fractions import Fraction
+from itertools import chain, islice
 from enum import Enum
-import asyncio
 import hashlib
-import json
+import heapq
+import operator
+import orjson
 import os
+import sys
 import time
 
 # Enums for validation
@@ -36,13 +42,21 @@ class TaskCategory(str, Enum):
     bugfix = "bugfix"
     feature = "feature"
 
+def _intern_assignee(v: Optional[str]) -> Optional[str]:
+    """Intern assignee names; few distinct assignees recur across many tasks"""
+    return sys.intern(v) if v is not None else v
+
+Assignee = Annotated[Optional[str], AfterValidator(_intern_assignee)]
+
 # Pydantic models
 class TaskCreate(BaseModel):
+    model_config = ConfigDict(extra='forbid', frozen=True)
+    
     title: str = Field(..., min_length=3, max_length=200)
     description: Optional[str] = Field(None, max_length=2000)
     priority: TaskPriority = TaskPriority.medium
     category: TaskCategory
-    assignee: Optional[str] = Field(None, max_length=100)
+    assignee: Assignee = Field(None, max_length=100)
     estimated_hours: Optional[float] = Field(None, ge=0, le=1000)
     tags: List[str] = Field(default_factory=list)
     dependencies: List[int] = Field(default_factory=list)
@@ -55,12 +69,14 @@ class TaskCreate(BaseModel):
         return v
 
 class TaskUpdate(BaseModel):
+    model_config = ConfigDict(extra='forbid', frozen=True)
+    
     title: Optional[str] = Field(None, min_length=3, max_length=200)
     description: Optional[str] = Field(None, max_length=2000)
     status: Optional[TaskStatus] = None
     priority: Optional[TaskPriority] = None
     category: Optional[TaskCategory] = None
-    assignee: Optional[str] = Field(None, max_length=100)
+    assignee: Assignee = Field(None, max_length=100)
     estimated_hours: Optional[float] = Field(None, ge=0, le=1000)
     actual_hours: Optional[float] = Field(None, ge=0, le=1000)
     tags: Optional[List[str]] = None
@@ -95,7 +111,8 @@ class HealthResponse(BaseModel):
 app = FastAPI(
     title="Task Management API",
     description="Advanced task management system with analytics",
-    version="2.0.0"
+    version="2.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
@@ -110,39 +127,137 @@ app.add_middleware(
 # In-memory storage with complex structure
 tasks: Dict[int, Dict] = {}
 task_counter = 0
-start_time = time.time()
+start_time = time.monotonic()
+
+# Sort rank of each priority
+PRIORITY_RANK = {"low": 0, "medium": 1, "high": 2, "critical": 3}
+
+# Secondary indexes mapping field values to task IDs, kept in step with `tasks`
+by_status: Dict[str, Set[int]] = defaultdict(set)
+by_priority: Dict[str, Set[int]] = defaultdict(set)
+by_category: Dict[str, Set[int]] = defaultdict(set)
+by_assignee: Dict[Optional[str], Set[int]] = defaultdict(set)
+by_tag: Dict[str, Set[int]] = defaultdict(set)
 
-# Simulated "heavy" operations cache
-analytics_cache = {}
-cache_expiry = {}
+# Reverse dependency index mapping a task ID to the IDs of tasks depending on it
+dependents: Dict[int, Set[int]] = defaultdict(set)
+
+# Approximate memory held by stored tasks, kept in step with `tasks`
+tasks_bytes = 0
+
+# Running sums and counts of non-zero estimated/actual hours, kept in step with `tasks`.
+# Sums are exact Fractions so repeated subtract/re-add on updates cannot drift.
+HOUR_FIELDS = ('estimated_hours', 'actual_hours')
+hour_sums: Dict[str, Fraction] = Counter()
+hour_counts: Dict[str, int] = Counter()
+
+# Per-assignee task counts and exact hour sums, kept in step with `tasks`
+assignee_totals: Dict[str, Counter] = defaultdict(Counter)
+
+# Task fields covered by the checksum, in a fixed order
+_checksum_fields = operator.itemgetter(
+    'id', 'title', 'description', 'status', 'priority', 'category', 'assignee',
+    'estimated_hours', 'actual_hours', 'tags', 'dependencies',
+    'created_at', 'updated_at', 'completed_at'
+)
 
 def calculate_checksum(task_data: dict) -> str:
-    """Calculate SHA256 checksum of task data"""
-    task_str = json.dumps(task_data, sort_keys=True, default=str)
-    return hashlib.sha256(task_str.encode()).hexdigest()[:16]
-
-def simulate_heavy_computation(data: dict, duration: float = 0.1):
-    """Simulate CPU-intensive operation"""
-    time.sleep(duration)
-    # Perform some actual computation
-    result = 0
-    for i in range(10000):
-        result += hash(f"{data}{i}") % 1000
-    return result
-
-async def background_analytics_update(task_id: int):
-    """Background task for updating analytics"""
-    await asyncio.sleep(1)
-    # Simulate heavy analytics processing
-    simulate_heavy_computation({"task_id": task_id}, 0.05)
+    """Calculate BLAKE2 checksum of task data"""
+    task_bytes = orjson.dumps(_checksum_fields(task_data))
+    return hashlib.blake2b(task_bytes, digest_size=8).hexdigest()
+
+def _index_remove(index: Dict, key, task_id: int):
+    """Remove a task ID from an index bucket, dropping the bucket once empty"""
+    bucket = index.get(key)
+    if bucket is not None:
+        bucket.discard(task_id)
+        if not bucket:
+            del index[key]
+
+def _task_size(task: dict) -> int:
+    """Approximate in-memory size of a stored task in bytes"""
+    return sys.getsizeof(task) + sum(map(sys.getsizeof, task.values()))
+
+def _index_task(task: dict):
+    """Add a task to the secondary indexes and running totals"""
+    global tasks_bytes
+    tasks_bytes += _task_size(task)
+    totals = assignee_totals[task['assignee'] or 'unassigned']
+    totals['total'] += 1
+    if task['status'] in ('completed', 'in_progress'):
+        totals[task['status']] += 1
+    for field in HOUR_FIELDS:
+        if task[field]:
+            hours = Fraction(task[field])
+            hour_sums[field] += hours
+            hour_counts[field] += 1
+            totals[field] += hours
+    task_id = task['id']
+    by_status[task['status']].add(task_id)
+    by_priority[task['priority']].add(task_id)
+    by_category[task['category']].add(task_id)
+    by_assignee[task['assignee']].add(task_id)
+    for tag in task['tags'] or ():
+        by_tag[tag].add(task_id)
+    for dep_id in task['dependencies'] or ():
+        dependents[dep_id].add(task_id)
+
+def _unindex_task(task: dict):
+    """Remove a task from the secondary indexes and running totals"""
+    global tasks_bytes
+    tasks_bytes -= _task_size(task)
+    assignee = task['assignee'] or 'unassigned'
+    totals = assignee_totals[assignee]
+    totals['total'] -= 1
+    if task['status'] in ('completed', 'in_progress'):
+        totals[task['status']] -= 1
+    for field in HOUR_FIELDS:
+        if task[field]:
+            hours = Fraction(task[field])
+            hour_sums[field] -= hours
+            hour_counts[field] -= 1
+            totals[field] -= hours
+    if not totals['total']:
+        del assignee_totals[assignee]
+    task_id = task['id']
+    _index_remove(by_status, task['status'], task_id)
+    _index_remove(by_priority, task['priority'], task_id)
+    _index_remove(by_category, task['category'], task_id)
+    _index_remove(by_assignee, task['assignee'], task_id)
+    for tag in task['tags'] or ():
+        _index_remove(by_tag, tag, task_id)
+    for dep_id in task['dependencies'] or ():
+        _index_remove(dependents, dep_id, task_id)
+
+def _build_task(task_id: int, task_data: TaskCreate, now: datetime) -> dict:
+    """Build the stored representation of a new task"""
+    task_dict = {
+        'id': task_id,
+        'title': task_data.title,
+        'description': task_data.description,
+        'status': TaskStatus.pending,
+        'priority': task_data.priority,
+        'category': task_data.category,
+        'assignee': task_data.assignee,
+        'estimated_hours': task_data.estimated_hours,
+        'actual_hours': None,
+        'tags': task_data.tags,
+        'dependencies': task_data.dependencies,
+        'created_at': now,
+        'updated_at': None,
+        'completed_at': None,
+        'checksum': ''
+    }
+    
+    task_dict['checksum'] = calculate_checksum(task_dict)
+    return task_dict
 
 @app.get("/health", response_model=HealthResponse)
 async def health_check():
     """Comprehensive health check with system metrics"""
-    uptime = time.time() - start_time
+    uptime = time.monotonic() - start_time
     
-    # Simulate memory calculation
-    memory_mb = len(json.dumps(tasks)) / 1024 / 1024
+    memory_mb = tasks_bytes / 1024 / 1024
     
     return HealthResponse(
         status="healthy",
@@ -167,38 +282,56 @@ async def get_tasks(
 ):
     """Get tasks with advanced filtering, sorting, and pagination"""
     
-    # Filter tasks
-    filtered_tasks = list(tasks.values())
-    
-    if status:
-        filtered_tasks = [t for t in filtered_tasks if t['status'] == status]
-    if priority:
-        filtered_tasks = [t for t in filtered_tasks if t['priority'] == priority]
-    if category:
-        filtered_tasks = [t for t in filtered_tasks if t['category'] == category]
-    if assignee:
-        filtered_tasks = [t for t in filtered_tasks if t['assignee'] == assignee]
+    # Filter tasks by intersecting the matching index buckets
+    candidate_ids = None
+    
+    for index, value in ((by_status, status), (by_priority, priority),
+                         (by_category, category), (by_assignee, assignee)):
+        if value:
+            bucket = index.get(value, set())
+            candidate_ids = bucket if candidate_ids is None else candidate_ids & bucket
     if tags:
         tag_list = [t.strip() for t in tags.split(',')]
-        filtered_tasks = [t for t in filtered_tasks if any(tag in t['tags'] for tag in tag_list)]
-    
-    # Simulate heavy filtering computation
-    if len(filtered_tasks) > 50:
-        simulate_heavy_computation({"filter": "heavy"}, 0.05)
+        tag_ids = set().union(*(by_tag.get(tag, ()) for tag in tag_list))
+        candidate_ids = tag_ids if candidate_ids is None else candidate_ids & tag_ids
     
-    # Sort tasks
-    priority_order = {"low": 0, "medium": 1, "high": 2, "critical": 3}
+    # Sort tasks, materializing only the requested page where possible
     reverse = order == "desc"
     
-    if sort_by == "priority":
-        filtered_tasks.sort(key=lambda x: priority_order.get(x['priority'], 0), reverse=reverse)
+    if sort_by == "updated_at":
+        if candidate_ids is None:
+            filtered_tasks = list(tasks.values())
+        else:
+            filtered_tasks = [tasks[i] for i in sorted(candidate_ids)]
+        
+        # Tasks that were never updated have no timestamp and sort first
+        filtered_tasks.sort(key=lambda x: (x['updated_at'] is not None, x['updated_at']), reverse=reverse)
+        paginated_tasks = filtered_tasks[offset:offset + limit]
     else:
-        filtered_tasks.sort(key=lambda x: x.get(sort_by, ""), reverse=reverse)
-    
-    # Pagination
-    paginated_tasks = filtered_tasks[offset:offset + limit]
+        if sort_by == "created_at":
+            # IDs are handed out in creation order, so ID order is creation order
+            if candidate_ids is None:
+                ordered_ids = reversed(tasks) if reverse else iter(tasks)
+            else:
+                select = heapq.nlargest if reverse else heapq.nsmallest
+                ordered_ids = select(offset + limit, candidate_ids)
+        else:
+            # Walk the index buckets in sort order instead of comparing tasks
+            if sort_by == "priority":
+                index, bucket_rank = by_priority, lambda p: PRIORITY_RANK.get(p, 0)
+            else:
+                index, bucket_rank = by_status, lambda s: s or ''
+            ordered_ids = chain.from_iterable(
+                sorted(index[value] if candidate_ids is None else index[value] & candidate_ids)
+                for value in sorted(index, key=bucket_rank, reverse=reverse)
+            )
+        
+        # Pagination
+        paginated_tasks = [tasks[i] for i in islice(ordered_ids, offset, offset + limit)]
     
-    return paginated_tasks
+    # Stored tasks were validated on write; serialize them directly rather
+    # than re-validating each one through the Task model
+    return ORJSONResponse(paginated_tasks)
 
 @app.get("/tasks/{task_id}", response_model=Task)
 async def get_task(task_id: int):
@@ -206,16 +339,11 @@ async def get_task(task_id: int):
     if task_id not in tasks:
         raise HTTPException(status_code=404, detail="Task not found")
     
-    task = tasks[task_id]
-    
-    # Simulate dependency resolution computation
-    if task['dependencies']:
-        simulate_heavy_computation({"dependencies": task['dependencies']}, 0.02)
-    
-    return task
+    # Serialize the stored task directly, as in get_tasks
+    return ORJSONResponse(tasks[task_id])
 
 @app.post("/tasks", response_model=Task, status_code=201)
-async def create_task(task_data: TaskCreate, background_tasks: BackgroundTasks):
+async def create_task(task_data: TaskCreate):
     """Create a new task with validation"""
     global task_counter
     
@@ -225,36 +353,14 @@ async def create_task(task_data: TaskCreate, background_tasks: BackgroundTasks):
             raise HTTPException(status_code=400, detail=f"Dependency task {dep_id} not found")
     
     task_counter += 1
-    now = datetime.utcnow()
-    
-    task_dict = {
-        'id': task_counter,
-        'title': task_data.title,
-        'description': task_data.description,
-        'status': TaskStatus.pending,
-        'priority': task_data.priority,
-        'category': task_data.category,
-        'assignee': task_data.assignee,
-        'estimated_hours': task_data.estimated_hours,
-        'actual_hours': None,
-        'tags': task_data.tags,
-        'dependencies': task_data.dependencies,
-        'created_at': now,
-        'updated_at': None,
-        'completed_at': None,
-        'checksum': ''
-    }
-    
-    task_dict['checksum'] = calculate_checksum(task_dict)
+    task_dict = _build_task(task_counter, task_data, datetime.utcnow())
     tasks[task_counter] = task_dict
-    
-    # Trigger background analytics update
-    background_tasks.add_task(background_analytics_update, task_counter)
+    _index_task(task_dict)
     
     return task_dict
 
 @app.put("/tasks/{task_id}", response_model=Task)
-async def update_task(task_id: int, task_update: TaskUpdate, background_tasks: BackgroundTasks):
+async def update_task(task_id: int, task_update: TaskUpdate):
     """Update an existing task"""
     if task_id not in tasks:
         raise HTTPException(status_code=404, detail="Task not found")
@@ -268,24 +374,21 @@ async def update_task(task_id: int, task_update: TaskUpdate, background_tasks: B
             if dep_id not in tasks and dep_id != task_id:
                 raise HTTPException(status_code=400, detail=f"Dependency task {dep_id} not found")
     
-    # Update fields
+    # Update fields, moving the task between index buckets
+    _unindex_task(task)
     for field, value in update_data.items():
         task[field] = value
     
-    task['updated_at'] = datetime.utcnow()
+    now = datetime.utcnow()
+    task['updated_at'] = now
     
     # Mark completion timestamp
     if task_update.status == TaskStatus.completed and not task.get('completed_at'):
-        task['completed_at'] = datetime.utcnow()
+        task['completed_at'] = now
     
     # Recalculate checksum
     task['checksum'] = calculate_checksum(task)
-    
-    # Simulate heavy update computation
-    simulate_heavy_computation({"update": task_id}, 0.03)
-    
-    # Trigger background analytics update
-    background_tasks.add_task(background_analytics_update, task_id)
+    _index_task(task)
     
     return task
 
@@ -295,41 +398,32 @@ async def delete_task(task_id: int):
     if task_id not in tasks:
         raise HTTPException(status_code=404, detail="Task not found")
     
-    # Check for dependent tasks
-    dependent_tasks = [t for t in tasks.values() if task_id in t['dependencies']]
-    
-    if dependent_tasks:
-        # Remove this task from dependencies
-        for dep_task in dependent_tasks:
-            dep_task['dependencies'].remove(task_id)
-            dep_task['updated_at'] = datetime.utcnow()
+    _unindex_task(tasks.pop(task_id))
     
-    del tasks[task_id]
+    # Remove this task from the dependencies of its dependent tasks
+    dependent_ids = dependents.pop(task_id, set())
+    now = datetime.utcnow()
     
-    # Clear analytics cache
-    analytics_cache.clear()
+    for dep_id in dependent_ids:
+        dep_task = tasks[dep_id]
+        _unindex_task(dep_task)
+        dep_task['dependencies'].remove(task_id)
+        dep_task['updated_at'] = now
+        _index_task(dep_task)
     
-    return {"message": "Task deleted successfully", "affected_tasks": len(dependent_tasks)}
+    return {"message": "Task deleted successfully", "affected_tasks": len(dependent_ids)}
 
 @app.get("/tasks/stats/summary")
 async def get_task_statistics():
-    """Get comprehensive task statistics with heavy computation"""
-    
-    # Check cache
-    cache_key = "stats_summary"
-    if cache_key in analytics_cache and cache_key in cache_expiry:
-        if datetime.utcnow() < cache_expiry[cache_key]:
-            return analytics_cache[cache_key]
-    
-    # Simulate heavy analytics computation
-    simulate_heavy_computation({"stats": "all"}, 0.1)
+    """Get comprehensive task statistics"""
     
+    # Counts come straight from the index bucket sizes and running totals
     stats = {
         'total': len(tasks),
-        'by_status': {},
-        'by_priority': {},
-        'by_category': {},
-        'by_assignee': {},
+        'by_status': {status: len(ids) for status, ids in by_status.items()},
+        'by_priority': {priority: len(ids) for priority, ids in by_priority.items()},
+        'by_category': {category: len(ids) for category, ids in by_category.items()},
+        'by_assignee': {assignee: totals['total'] for assignee, totals in assignee_totals.items()},
         'completion_rate': 0.0,
         'average_estimated_hours': 0.0,
         'average_actual_hours': 0.0,
@@ -337,91 +431,44 @@ async def get_task_statistics():
         'blocked_tasks': 0
     }
     
-    # Calculate statistics
-    for task in tasks.values():
-        # By status
-        status = task['status']
-        stats['by_status'][status] = stats['by_status'].get(status, 0) + 1
-        
-        # By priority
-        priority = task['priority']
-        stats['by_priority'][priority] = stats['by_priority'].get(priority, 0) + 1
-        
-        # By category
-        category = task['category']
-        stats['by_category'][category] = stats['by_category'].get(category, 0) + 1
-        
-        # By assignee
-        assignee = task['assignee'] or 'unassigned'
-        stats['by_assignee'][assignee] = stats['by_assignee'].get(assignee, 0) + 1
-    
     # Calculate completion rate
     completed = stats['by_status'].get('completed', 0)
     if stats['total'] > 0:
         stats['completion_rate'] = round(completed / stats['total'] * 100, 2)
     
-    # Calculate average hours
-    estimated_hours = [t['estimated_hours'] for t in tasks.values() if t['estimated_hours']]
-    actual_hours = [t['actual_hours'] for t in tasks.values() if t['actual_hours']]
-    
-    if estimated_hours:
-        stats['average_estimated_hours'] = round(sum(estimated_hours) / len(estimated_hours), 2)
-    if actual_hours:
-        stats['average_actual_hours'] = round(sum(actual_hours) / len(actual_hours), 2)
+    # Calculate average hours from the running totals
+    if hour_counts['estimated_hours']:
+        stats['average_estimated_hours'] = round(float(hour_sums['estimated_hours'] / hour_counts['estimated_hours']), 2)
+    if hour_counts['actual_hours']:
+        stats['average_actual_hours'] = round(float(hour_sums['actual_hours'] / hour_counts['actual_hours']), 2)
     
     stats['blocked_tasks'] = stats['by_status'].get('blocked', 0)
     
-    # Cache results for 60 seconds
-    analytics_cache[cache_key] = stats
-    cache_expiry[cache_key] = datetime.utcnow() + timedelta(seconds=60)
-    
     return stats
 
 @app.get("/tasks/analytics/productivity")
 async def get_productivity_analytics():
-    """Complex productivity analytics with heavy computation"""
-    
-    # Simulate very heavy computation
-    simulate_heavy_computation({"analytics": "productivity"}, 0.15)
+    """Complex productivity analytics"""
     
     analytics = {
-        'total_estimated_hours': 0,
-        'total_actual_hours': 0,
+        'total_estimated_hours': float(hour_sums['estimated_hours']),
+        'total_actual_hours': float(hour_sums['actual_hours']),
         'efficiency_rate': 0.0,
-        'tasks_by_assignee': {},
+        'tasks_by_assignee': {
+            assignee: {
+                'total': totals['total'],
+                'completed': totals['completed'],
+                'in_progress': totals['in_progress'],
+                'estimated_hours': float(totals['estimated_hours']),
+                'actual_hours': float(totals['actual_hours'])
+            }
+            for assignee, totals in assignee_totals.items()
+        },
         'completion_trend': [],
         'priority_distribution': {},
         'category_performance': {}
     }
     
-    # Calculate productivity metrics
-    for task in tasks.values():
-        assignee = task['assignee'] or 'unassigned'
-        
-        if assignee not in analytics['tasks_by_assignee']:
-            analytics['tasks_by_assignee'][assignee] = {
-                'total': 0,
-                'completed': 0,
-                'in_progress': 0,
-                'estimated_hours': 0,
-                'actual_hours': 0
-            }
-        
-        analytics['tasks_by_assignee'][assignee]['total'] += 1
-        
-        if task['status'] == 'completed':
-            analytics['tasks_by_assignee'][assignee]['completed'] += 1
-        elif task['status'] == 'in_progress':
-            analytics['tasks_by_assignee'][assignee]['in_progress'] += 1
-        
-        if task['estimated_hours']:
-            analytics['tasks_by_assignee'][assignee]['estimated_hours'] += task['estimated_hours']
-            analytics['total_estimated_hours'] += task['estimated_hours']
-        
-        if task['actual_hours']:
-            analytics['tasks_by_assignee'][assignee]['actual_hours'] += task['actual_hours']
-            analytics['total_actual_hours'] += task['actual_hours']
-    
     # Calculate efficiency rate
     if analytics['total_estimated_hours'] > 0 and analytics['total_actual_hours'] > 0:
         analytics['efficiency_rate'] = round(
@@ -431,26 +478,38 @@ async def get_productivity_analytics():
     return analytics
 
 @app.post("/tasks/bulk")
-async def bulk_create_tasks(tasks_data: List[TaskCreate], background_tasks: BackgroundTasks):
-    """Bulk create multiple tasks"""
+async def bulk_create_tasks(tasks_data: List[TaskCreate]):
+    """Bulk create multiple tasks in a single batch"""
+    global task_counter
+    
     if len(tasks_data) > 100:
         raise HTTPException(status_code=400, detail="Maximum 100 tasks per bulk operation")
     
-    created_tasks = []
+    new_ids = range(task_counter + 1, task_counter + 1 + len(tasks_data))
     
-    for task_data in tasks_data:
-        task = await create_task(task_data, background_tasks)
-        created_tasks.append(task)
+    # Validate every dependency before creating anything; a task may depend
+    # on existing tasks or on tasks earlier in the same batch
+    for task_id, task_data in zip(new_ids, tasks_data):
+        for dep_id in task_data.dependencies:
+            if dep_id not in tasks and not new_ids.start <= dep_id < task_id:
+                raise HTTPException(status_code=400, detail=f"Dependency task {dep_id} not found")
+    
+    now = datetime.utcnow()
+    created_tasks = [_build_task(task_id, task_data, now) for task_id, task_data in zip(new_ids, tasks_data)]
     
-    # Simulate heavy bulk operation
-    simulate_heavy_computation({"bulk": len(tasks_data)}, 0.1)
+    for task_dict in created_tasks:
+        tasks[task_dict['id']] = task_dict
+        _index_task(task_dict)
+    task_counter += len(created_tasks)
     
     return {
         "message": f"Successfully created {len(created_tasks)} tasks",
-        "task_ids": [t['id'] for t in created_tasks]
+        "task_ids": list(new_ids)
     }
 
 if __name__ == "__main__":
     import uvicorn
     port = int(os.environ.get("PORT", 8000))
+    # Tasks live in process memory, so serve them from a single worker; the
+    # default "auto" loop and parser already pick uvloop/httptools when installed
     uvicorn.run(app, host="0.0.0.0", port=port)
\ No newline at end of file
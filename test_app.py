@@ -11,6 +11,7 @@ import pytest
 import pytest_asyncio
 from httpx import AsyncClient
 from app import app
+import app as app_module
 
 
 @pytest_asyncio.fixture
@@ -31,6 +32,38 @@ async def test_health_check(client):
     assert 'total_tasks' in data
 
 
+@pytest.mark.asyncio
+async def test_health_check_memory_tracking(client):
+    """Test that the health check memory estimate follows task changes"""
+    before = app_module.tasks_bytes
+    
+    task1_id = (await client.post('/tasks', json={
+        'title': 'Health Task',
+        'category': 'deployment'
+    })).json()['id']
+    after_create = app_module.tasks_bytes
+    assert after_create > before
+    
+    await client.put(f'/tasks/{task1_id}', json={'description': 'Now with a description'})
+    assert app_module.tasks_bytes != after_create
+    
+    task2_id = (await client.post('/tasks', json={
+        'title': 'Health Dependent',
+        'category': 'deployment',
+        'dependencies': [task1_id]
+    })).json()['id']
+    after_dependent = app_module.tasks_bytes
+    
+    response = await client.get('/health')
+    assert response.status_code == 200
+    assert response.json()['memory_usage_mb'] == round(after_dependent / 1024 / 1024, 2)
+    
+    # Deleting task1 also rewrites task2's dependencies and updated_at
+    await client.delete(f'/tasks/{task1_id}')
+    await client.delete(f'/tasks/{task2_id}')
+    assert app_module.tasks_bytes == before
+
+
 @pytest.mark.asyncio
 async def test_create_task(client):
     """Test task creation"""
@@ -69,6 +102,17 @@ async def test_create_task_invalid_priority(client):
     assert response.status_code == 422
 
 
+@pytest.mark.asyncio
+async def test_create_task_unknown_field(client):
+    """Test task creation with a field the API does not accept"""
+    response = await client.post('/tasks', json={
+        'title': 'Test Task',
+        'category': 'development',
+        'status': 'completed'
+    })
+    assert response.status_code == 422
+
+
 @pytest.mark.asyncio
 async def test_get_tasks(client):
     """Test getting all tasks"""
@@ -107,6 +151,70 @@ async def test_get_tasks_with_filters(client):
     assert all(task['priority'] == 'high' for task in data)
 
 
+@pytest.mark.asyncio
+async def test_get_tasks_filters_follow_updates(client):
+    """Test that filters reflect updated and deleted tasks"""
+    create_response = await client.post('/tasks', json={
+        'title': 'Indexed Task',
+        'category': 'feature',
+        'assignee': 'index.tester',
+        'tags': ['indexed']
+    })
+    task_id = create_response.json()['id']
+    
+    response = await client.get('/tasks?assignee=index.tester&tags=indexed,other')
+    assert [t['id'] for t in response.json()] == [task_id]
+    
+    await client.put(f'/tasks/{task_id}', json={'status': 'blocked', 'tags': ['moved']})
+    
+    response = await client.get('/tasks?assignee=index.tester&status=pending')
+    assert response.json() == []
+    response = await client.get('/tasks?assignee=index.tester&status=blocked&tags=moved')
+    assert [t['id'] for t in response.json()] == [task_id]
+    response = await client.get('/tasks?tags=indexed')
+    assert task_id not in [t['id'] for t in response.json()]
+    
+    await client.delete(f'/tasks/{task_id}')
+    response = await client.get('/tasks?assignee=index.tester')
+    assert response.json() == []
+
+
+@pytest.mark.asyncio
+async def test_get_tasks_sorting(client):
+    """Test sorting tasks by priority and update time"""
+    for priority in ['medium', 'critical', 'low']:
+        await client.post('/tasks', json={
+            'title': f'Sorted {priority}',
+            'category': 'testing',
+            'assignee': 'sort.tester',
+            'priority': priority
+        })
+    
+    response = await client.get('/tasks?assignee=sort.tester&sort_by=priority&order=asc')
+    assert [t['priority'] for t in response.json()] == ['low', 'medium', 'critical']
+    
+    low_id = response.json()[0]['id']
+    await client.put(f'/tasks/{low_id}', json={'priority': 'high'})
+    
+    response = await client.get('/tasks?assignee=sort.tester&sort_by=priority')
+    assert [t['priority'] for t in response.json()] == ['critical', 'high', 'medium']
+    
+    response = await client.get('/tasks?assignee=sort.tester&sort_by=updated_at')
+    assert response.status_code == 200
+    assert response.json()[0]['id'] == low_id
+    
+    response = await client.get('/tasks?assignee=sort.tester')
+    ids = [t['id'] for t in response.json()]
+    assert ids == sorted(ids, reverse=True)
+    
+    response = await client.get('/tasks?assignee=sort.tester&limit=1&offset=1&order=asc')
+    assert [t['id'] for t in response.json()] == [ids[1]]
+    
+    await client.put(f'/tasks/{ids[0]}', json={'status': 'in_progress'})
+    response = await client.get('/tasks?assignee=sort.tester&sort_by=status&order=asc')
+    assert [t['status'] for t in response.json()] == ['in_progress', 'pending', 'pending']
+
+
 @pytest.mark.asyncio
 async def test_get_tasks_pagination(client):
     """Test task pagination"""
@@ -122,6 +230,10 @@ async def test_get_tasks_pagination(client):
     assert response.status_code == 200
     data = response.json()
     assert len(data) <= 2
+    
+    # Newest tasks come first by default
+    response = await client.get('/tasks?limit=2&offset=1')
+    assert [t['title'] for t in response.json()] == ['Task 3', 'Task 2']
 
 
 @pytest.mark.asyncio
@@ -238,6 +350,37 @@ async def test_delete_task_with_dependencies(client):
     assert data['affected_tasks'] == 1
 
 
+@pytest.mark.asyncio
+async def test_delete_task_after_dependency_update(client):
+    """Test that dependents follow dependency changes made by updates"""
+    task1_id = (await client.post('/tasks', json={
+        'title': 'Task 1',
+        'category': 'development'
+    })).json()['id']
+    task2_id = (await client.post('/tasks', json={
+        'title': 'Task 2',
+        'category': 'development'
+    })).json()['id']
+    task3_id = (await client.post('/tasks', json={
+        'title': 'Task 3',
+        'category': 'development',
+        'dependencies': [task1_id]
+    })).json()['id']
+    
+    # Move task3's dependency from task1 to task2
+    await client.put(f'/tasks/{task3_id}', json={'dependencies': [task2_id]})
+    
+    response = await client.delete(f'/tasks/{task1_id}')
+    assert response.json()['affected_tasks'] == 0
+    
+    response = await client.delete(f'/tasks/{task2_id}')
+    assert response.json()['affected_tasks'] == 1
+    
+    task3 = (await client.get(f'/tasks/{task3_id}')).json()
+    assert task3['dependencies'] == []
+    assert task3['updated_at'] is not None
+
+
 @pytest.mark.asyncio
 async def test_get_statistics(client):
     """Test getting task statistics"""
@@ -263,6 +406,32 @@ async def test_get_statistics(client):
     assert 'completion_rate' in data
 
 
+@pytest.mark.asyncio
+async def test_get_statistics_follow_changes(client):
+    """Test that statistics reflect creates, updates and deletes immediately"""
+    before = (await client.get('/tasks/stats/summary')).json()
+    
+    create_response = await client.post('/tasks', json={
+        'title': 'Stats Task',
+        'category': 'documentation',
+        'assignee': 'stats.tester'
+    })
+    task_id = create_response.json()['id']
+    await client.put(f'/tasks/{task_id}', json={'status': 'blocked'})
+    
+    data = (await client.get('/tasks/stats/summary')).json()
+    assert data['total'] == before['total'] + 1
+    assert data['blocked_tasks'] == before['blocked_tasks'] + 1
+    assert data['by_assignee']['stats.tester'] == 1
+    
+    await client.delete(f'/tasks/{task_id}')
+    
+    data = (await client.get('/tasks/stats/summary')).json()
+    assert data['total'] == before['total']
+    assert data['blocked_tasks'] == before['blocked_tasks']
+    assert 'stats.tester' not in data['by_assignee']
+
+
 @pytest.mark.asyncio
 async def test_get_productivity_analytics(client):
     """Test getting productivity analytics"""
@@ -282,6 +451,72 @@ async def test_get_productivity_analytics(client):
     assert 'efficiency_rate' in data
 
 
+@pytest.mark.asyncio
+async def test_get_productivity_analytics_by_assignee(client):
+    """Test per-assignee productivity after updates"""
+    create_response = await client.post('/tasks', json={
+        'title': 'Productivity Task',
+        'category': 'development',
+        'assignee': 'productivity.tester',
+        'estimated_hours': 4.0
+    })
+    task_id = create_response.json()['id']
+    await client.put(f'/tasks/{task_id}', json={'status': 'completed', 'actual_hours': 2.0})
+    
+    response = await client.get('/tasks/analytics/productivity')
+    data = response.json()
+    assert data['tasks_by_assignee']['productivity.tester'] == {
+        'total': 1,
+        'completed': 1,
+        'in_progress': 0,
+        'estimated_hours': 4.0,
+        'actual_hours': 2.0
+    }
+    
+    await client.put(f'/tasks/{task_id}', json={'assignee': 'other.tester'})
+    
+    response = await client.get('/tasks/analytics/productivity')
+    data = response.json()
+    assert 'productivity.tester' not in data['tasks_by_assignee']
+    assert data['tasks_by_assignee']['other.tester']['completed'] == 1
+
+
+@pytest.mark.asyncio
+async def test_get_productivity_analytics_exact_hours(client):
+    """Test that hour totals stay exact after deletes"""
+    before = (await client.get('/tasks/analytics/productivity')).json()
+    
+    task_ids = []
+    for hours in [0.1, 0.2, 4.0]:
+        response = await client.post('/tasks', json={
+            'title': f'Hours {hours}',
+            'category': 'development',
+            'assignee': 'hours.tester',
+            'estimated_hours': hours
+        })
+        task_ids.append(response.json()['id'])
+    other_response = await client.post('/tasks', json={
+        'title': 'Unestimated',
+        'category': 'development',
+        'assignee': 'hours.tester'
+    })
+    
+    await client.delete(f'/tasks/{task_ids[0]}')
+    await client.delete(f'/tasks/{task_ids[1]}')
+    
+    data = (await client.get('/tasks/analytics/productivity')).json()
+    assert data['tasks_by_assignee']['hours.tester']['estimated_hours'] == 4.0
+    assert data['total_estimated_hours'] == before['total_estimated_hours'] + 4.0
+    
+    await client.delete(f'/tasks/{task_ids[2]}')
+    
+    data = (await client.get('/tasks/analytics/productivity')).json()
+    assert data['tasks_by_assignee']['hours.tester']['estimated_hours'] == 0
+    assert data['total_estimated_hours'] == before['total_estimated_hours']
+    
+    await client.delete(f"/tasks/{other_response.json()['id']}")
+
+
 @pytest.mark.asyncio
 async def test_bulk_create_tasks(client):
     """Test bulk task creation"""
@@ -313,4 +548,42 @@ async def test_bulk_create_tasks_limit(client):
     ]
     
     response = await client.post('/tasks/bulk', json=tasks_data)
-    assert response.status_code == 400
\ No newline at end of file
+    assert response.status_code == 400
+
+@pytest.mark.asyncio
+async def test_bulk_create_tasks_with_dependencies(client):
+    """Test bulk creation with dependencies inside the batch"""
+    anchor_response = await client.post('/tasks', json={
+        'title': 'Bulk Anchor',
+        'category': 'development'
+    })
+    anchor_id = anchor_response.json()['id']
+    
+    response = await client.post('/tasks/bulk', json=[
+        {'title': 'Bulk Parent', 'category': 'development', 'dependencies': [anchor_id]},
+        {'title': 'Bulk Child', 'category': 'development', 'dependencies': [anchor_id + 1]}
+    ])
+    assert response.status_code == 200
+    assert response.json()['task_ids'] == [anchor_id + 1, anchor_id + 2]
+    
+    child = (await client.get(f'/tasks/{anchor_id + 2}')).json()
+    assert child['dependencies'] == [anchor_id + 1]
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_tasks_invalid_dependency(client):
+    """Test that a bulk batch with an unknown dependency creates nothing"""
+    anchor_response = await client.post('/tasks', json={
+        'title': 'Bulk Anchor',
+        'category': 'development'
+    })
+    anchor_id = anchor_response.json()['id']
+    
+    response = await client.post('/tasks/bulk', json=[
+        {'title': 'Bulk Valid', 'category': 'development'},
+        {'title': 'Bulk Invalid', 'category': 'development', 'dependencies': [anchor_id + 3]}
+    ])
+    assert response.status_code == 400
+    
+    get_response = await client.get(f'/tasks/{anchor_id + 1}')
+    assert get_response.status_code == 404